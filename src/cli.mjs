@@ -5,8 +5,9 @@
  */
 
 import fs from 'fs';
+import readline from 'readline';
 import logger from './logger.mjs';
-import { connect, moveUidsToTrash, closeConnection } from './services/email/trash-mover.mjs';
+import { connect, moveUidsToTrash, closeConnection, searchMailbox, TrashMover } from './services/email/trash-mover.mjs';
 
 /**
  * Parse command-line arguments for trash-move command.
@@ -21,7 +22,9 @@ function _parseTrashMoveArgs(argv) {
     source: 'INBOX',
     target: null,
     uids: null,
+    search: null,
     dryRun: false,
+    daemon: false,
     envFile: '.env',
   };
 
@@ -39,8 +42,12 @@ function _parseTrashMoveArgs(argv) {
       args.target = argv[++i];
     } else if (arg === '--uids') {
       args.uids = argv[++i];
+    } else if (arg === '--search') {
+      args.search = argv[++i];
     } else if (arg === '--dry-run') {
       args.dryRun = true;
+    } else if (arg === '--daemon') {
+      args.daemon = true;
     } else if (arg === '--env-file') {
       args.envFile = argv[++i];
     } else if (arg === '--help') {
@@ -61,31 +68,63 @@ Move emails to trash via IMAP.
 
 Usage:
   npm run trash-move -- --uids <uid-list> [options]
+  npm run trash-move -- --search <criteria> [options]
 
 Options:
-  --uids <list>          Comma-separated UIDs to move (required)
+  --uids <list>          Comma-separated UIDs to move
+  --search <criteria>    Move messages matching an IMAP SEARCH instead of
+                         an explicit UID list (e.g. 'FROM "x@y.com" SEEN')
   --user <email>         Email address (or set EMAIL_USER)
   --password <pass>      Email password (or set EMAIL_PASS)
   --host <host>          IMAP host (default: imap.mail.me.com)
   --source <mailbox>     Source mailbox (default: INBOX)
   --target <mailbox>     Target mailbox (auto-detect if omitted)
   --dry-run              Preview without executing
+  --daemon               Read UID batches from stdin (one comma-separated
+                         batch per line), reusing a single IMAP connection
   --env-file <path>      Load .env file (default: .env)
   --help                 Show this help
 
 Examples:
   npm run trash-move -- --uids 130,131
   npm run trash-move -- --user alice@icloud.com --uids 130,131 --dry-run
+  echo "130,131" | npm run trash-move -- --daemon
 `);
 }
 
 /**
- * Get environment variable.
- * @param {string} key - Variable name
- * @returns {string|null} Value or null
+ * Run trash-move in daemon mode: read UID batches from stdin over a
+ * single persistent IMAP connection instead of logging in per batch.
+ * @param {Object} args - Parsed arguments
+ * @param {string} user - Email address
+ * @param {string} password - Email password
+ * @returns {Promise<void>}
  */
-function _getEnvVar(key) {
-  return process.env[key] || null;
+async function _runTrashMoveDaemon(args, user, password) {
+  const mover = new TrashMover(args.host, user, password);
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+  logger.info('Daemon mode: reading UID batches from stdin', { host: args.host, user });
+
+  try {
+    for await (const line of rl) {
+      const uids = line
+        .split(',')
+        .map((u) => u.trim())
+        .filter((u) => u);
+
+      if (uids.length === 0) continue;
+
+      try {
+        const successCount = await mover.moveUidsToTrash(args.source, uids, args.target, args.dryRun);
+        logger.info('Batch moved', { successCount, total: uids.length });
+      } catch (err) {
+        logger.error('Batch move failed', { error: err.message });
+      }
+    }
+  } finally {
+    await mover.close();
+  }
 }
 
 /**
@@ -110,8 +149,8 @@ export async function moveEmailsToTrashCli(argv) {
   }
 
   // Get credentials
-  let user = args.user || _getEnvVar('EMAIL_USER');
-  let password = args.password || _getEnvVar('EMAIL_PASS');
+  const user = args.user || process.env.EMAIL_USER || null;
+  const password = args.password || process.env.EMAIL_PASS || null;
 
   if (!user) {
     throw new Error('Email user required (--user or EMAIL_USER env)');
@@ -121,18 +160,26 @@ export async function moveEmailsToTrashCli(argv) {
     throw new Error('Email password required (--password or EMAIL_PASS env)');
   }
 
-  // Validate UIDs
-  if (!args.uids) {
-    throw new Error('UIDs required (--uids comma-separated)');
+  if (args.daemon) {
+    await _runTrashMoveDaemon(args, user, password);
+    return;
+  }
+
+  // Validate UID source
+  if (!args.uids && !args.search) {
+    throw new Error('UIDs required (--uids comma-separated, or --search <criteria>)');
   }
 
-  const uids = args.uids
-    .split(',')
-    .map((u) => u.trim())
-    .filter((u) => u);
+  let uids = null;
+  if (args.uids) {
+    uids = args.uids
+      .split(',')
+      .map((u) => u.trim())
+      .filter((u) => u);
 
-  if (uids.length === 0) {
-    throw new Error('No valid UIDs provided');
+    if (uids.length === 0) {
+      throw new Error('No valid UIDs provided');
+    }
   }
 
   let imap;
@@ -140,6 +187,15 @@ export async function moveEmailsToTrashCli(argv) {
     logger.info('Connecting to IMAP server...', { host: args.host, user });
     imap = await connect(args.host, user, password);
 
+    if (!uids) {
+      const found = await searchMailbox(imap, args.source, args.search);
+      if (found.length === 0) {
+        logger.info('No messages matched search criteria', { criteria: args.search });
+        return;
+      }
+      uids = found.map((u) => String(u));
+    }
+
     logger.info('Moving UIDs to trash...', { count: uids.length, dryRun: args.dryRun });
     const successCount = await moveUidsToTrash(imap, args.source, uids, args.target, args.dryRun);
 
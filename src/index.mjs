@@ -15,23 +15,26 @@
 
 import 'dotenv/config';
 import logger from './logger.mjs';
-import { syncPlaylistsFromEmails, setupOAuth } from './services/sync/playlists.mjs';
-import { moveEmailsToTrashCli } from './cli.mjs';
 
 const command = process.argv[2];
 const args = process.argv.slice(3);
 
+// Services are imported per command so each invocation only loads the
+// dependency tree it actually uses (cheerio, node-imap, simple-oauth2, ...)
 async function main() {
   try {
     if (command === '--auth' || command === 'auth') {
       logger.info('Starting Spotify OAuth authentication');
+      const { setupOAuth } = await import('./services/sync/playlists.mjs');
       await setupOAuth();
     } else if (command === 'trash-move' || command === 'move-trash') {
       logger.info('Moving emails to trash', { argsCount: args.length });
+      const { moveEmailsToTrashCli } = await import('./cli.mjs');
       await moveEmailsToTrashCli(args);
     } else {
       // Default: sync playlists
       logger.info('Creating Spotify playlists from Pitchfork emails');
+      const { syncPlaylistsFromEmails } = await import('./services/sync/playlists.mjs');
       await syncPlaylistsFromEmails();
     }
   } catch (err) {
@@ -56,6 +56,17 @@ export function debug(message, context = {}) {
   }
 }
 
+/**
+ * Checks whether a level would be emitted at the current setting.
+ * Lets hot paths skip building expensive log context when the call
+ * would be dropped anyway.
+ * @param {string} level - One of: 'error', 'warn', 'info', 'debug'
+ * @returns {boolean} True if messages at this level are emitted
+ */
+export function isLevelEnabled(level) {
+  return LOG_LEVELS[level] <= currentLevel;
+}
+
 /**
  * Sets the logging level.
  * @param {string} level - One of: 'error', 'warn', 'info', 'debug'
@@ -72,5 +83,6 @@ export default {
   warn,
   info,
   debug,
+  isLevelEnabled,
   setLevel,
 };
@@ -10,6 +10,11 @@ import { decodeMimeEncodedWords } from '../../utils/text.mjs';
 
 const BATCH_SIZE = 20; // Process emails in batches
 
+// Compiled once at module load; header parsing runs per fetched message
+const DATE_HEADER_RE = /^Date:\s*(.*)$/im;
+const FROM_HEADER_RE = /^From:\s*(.*)$/im;
+const SUBJECT_HEADER_RE = /^Subject:\s*(.*)$/im;
+
 /**
  * Open IMAP connection.
  * @returns {Promise<Object>} IMAP connection
@@ -99,9 +104,9 @@ export async function fetchAllMatchingEmails() {
           for (const { uid, headers, body } of messages) {
             const validUid = Number.isInteger(uid) ? uid : (typeof uid === 'number' && !isNaN(uid) ? Math.trunc(uid) : null);
 
-            const dateMatch = headers.match(/^Date:\s*(.*)$/im);
-            const fromMatch = headers.match(/^From:\s*(.*)$/im);
-            const subjectMatch = headers.match(/^Subject:\s*(.*)$/im);
+            const dateMatch = headers.match(DATE_HEADER_RE);
+            const fromMatch = headers.match(FROM_HEADER_RE);
+            const subjectMatch = headers.match(SUBJECT_HEADER_RE);
 
             const date = dateMatch ? new Date(dateMatch[1]) : new Date();
             const from = decodeMimeEncodedWords(fromMatch ? fromMatch[1] : '');
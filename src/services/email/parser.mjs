@@ -8,6 +8,10 @@ import { load as loadHtml } from 'cheerio';
 import { decodeQuotedPrintable } from '../../utils/text.mjs';
 import logger from '../../logger.mjs';
 
+// "Artist: Album" / "Artist – Album" pattern in image alt/title text,
+// compiled once at module load
+const IMG_PAIR_RE = /^(.{2,80})\s*[:–-]\s*(.{2,140})$/;
+
 /**
  * Extract album-artist pairs from email body.
  * @param {string} rawBody - HTML email body
@@ -15,21 +19,23 @@ import logger from '../../logger.mjs';
  */
 export function extractAlbumArtistPairs(rawBody) {
   const pairs = [];
+  const seenKeys = new Set();
 
   const addPair = (artist, album) => {
     let a = (artist || '').trim();
     let b = (album || '').trim();
-    
+
     // Decode Quoted-Printable encoded text
     a = decodeQuotedPrintable(a);
     b = decodeQuotedPrintable(b);
-    
+
     a = a.trim();
     b = b.trim();
-    
+
     if (!a || !b || a.length < 2 || b.length < 2) return;
     const key = `${a.toLowerCase()}::${b.toLowerCase()}`;
-    if (!pairs.some((p) => `${p.artist.toLowerCase()}::${p.album.toLowerCase()}` === key)) {
+    if (!seenKeys.has(key)) {
+      seenKeys.add(key);
       pairs.push({ artist: a, album: b });
     }
   };
@@ -91,7 +97,6 @@ export function extractAlbumArtistPairs(rawBody) {
 
     // Image metadata
     if (pairs.length < 10) {
-      const pat = /^(.{2,80})\s*[:–-]\s*(.{2,140})$/;
       $('img[alt], img[title]').each((_, img) => {
         if (pairs.length >= 10) return;
         let alt = ($(img).attr('alt') || '').trim();
@@ -103,7 +108,7 @@ export function extractAlbumArtistPairs(rawBody) {
         
         const candidates = [alt, title].filter(Boolean);
         for (const txt of candidates) {
-          const m = txt.match(pat);
+          const m = txt.match(IMG_PAIR_RE);
           if (m) {
             addPair(m[1], m[2]);
             if (pairs.length >= 10) break;
@@ -12,6 +12,22 @@ const DEFAULT_HOST = 'imap.mail.me.com';
 const DEFAULT_PORT = 993;
 const TRASH_KEYWORDS = ['trash', 'deleted', 'papierkorb', 'gelöscht', 'eliminados'];
 
+// Exact-token probe for the common case of single-token names ("Trash",
+// "INBOX/Trash"); set membership beats a substring scan there
+const TRASH_TOKENS = new Set(TRASH_KEYWORDS);
+const MAILBOX_TOKEN_SPLIT_RE = /[/\s]+/;
+
+// One alternation scan over the name instead of one includes() per keyword;
+// fallback for composite names like "Deleted Messages2". Keywords are
+// escaped so the alternation always matches them literally.
+const TRASH_NAME_RE = new RegExp(
+  TRASH_KEYWORDS.map((k) => k.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|')
+);
+
+// Compiled once at module load; LIST parsing runs per mailbox line
+const LIST_LINE_RE = /\((?<flags>[^)]*)\).*"(?<name>.+)"\s*$/;
+const LIST_NAME_RE = /"(?<name>[^"]+)"\s*$/;
+
 /**
  * Connect to IMAP server.
  * @param {string} host - IMAP host
@@ -32,6 +48,8 @@ export async function connect(host, user, password, port = DEFAULT_PORT) {
       port,
       tls: true,
       autotls: 'required',
+      // NOOP while idle so iCloud doesn't drop the connection (~30 min idle limit)
+      keepalive: { interval: 10000, idleInterval: 300000, forceNoop: true },
     });
 
     imap.once('ready', () => {
@@ -56,14 +74,14 @@ export async function connect(host, user, password, port = DEFAULT_PORT) {
 function _parseListLine(lineBytes) {
   try {
     const line = lineBytes.toString();
-    const match = line.match(/\((?<flags>[^)]*)\).*"(?<name>.+)"\s*$/);
+    const match = line.match(LIST_LINE_RE);
     if (match) {
       return {
         flags: match.groups.flags.trim(),
         name: match.groups.name.trim(),
       };
     }
-    const fallbackMatch = line.match(/"(?<name>[^"]+)"\s*$/);
+    const fallbackMatch = line.match(LIST_NAME_RE);
     if (fallbackMatch) {
       return {
         flags: null,
@@ -101,30 +119,38 @@ async function _listMailboxes(imap) {
 /**
  * Find trash folder via SPECIAL-USE flags or name heuristics.
  * @param {Object} imap - IMAP connection
+ * @param {Array} [boxes] - Pre-listed mailboxes; avoids a second LIST round-trip
  * @returns {Promise<string|null>} Exact mailbox name or null
  */
-export async function findTrashFolder(imap) {
+export async function findTrashFolder(imap, boxes = null) {
   logger.info('Looking for trash folder via LIST');
-  
-  const boxes = await _listMailboxes(imap);
-  
-  // Primary: look for special-use flags
+
+  if (!boxes) {
+    boxes = await _listMailboxes(imap);
+  }
+
+  // Single pass: return on a special-use flag immediately, remembering
+  // the first keyword match as a fallback candidate
+  let probable = null;
   for (const { flags, name } of boxes) {
     if (flags && (flags.includes('\\Trash') || flags.includes('\\Deleted'))) {
       logger.info('Found special-use trash folder', { name, flags });
       return name;
     }
-  }
-  
-  // Secondary: name contains keyword
-  for (const { flags, name } of boxes) {
-    const nameLower = name.toLowerCase();
-    if (TRASH_KEYWORDS.some((k) => nameLower.includes(k))) {
-      logger.info('Found probable trash folder by name', { name, flags });
-      return name;
+    if (!probable) {
+      const nameLower = name.toLowerCase();
+      const tokens = nameLower.split(MAILBOX_TOKEN_SPLIT_RE);
+      if (tokens.some((tok) => TRASH_TOKENS.has(tok)) || TRASH_NAME_RE.test(nameLower)) {
+        probable = { name, flags };
+      }
     }
   }
-  
+
+  if (probable) {
+    logger.info('Found probable trash folder by name', probable);
+    return probable.name;
+  }
+
   logger.info('No trash folder found via heuristics');
   return null;
 }
@@ -133,10 +159,13 @@ export async function findTrashFolder(imap) {
  * Ensure mailbox exists; create if missing.
  * @param {Object} imap - IMAP connection
  * @param {string} target - Target mailbox name
+ * @param {Array} [boxes] - Pre-listed mailboxes; avoids a second LIST round-trip
  * @returns {Promise<boolean>} True if present/created
  */
-export async function ensureMailbox(imap, target) {
-  const boxes = await _listMailboxes(imap);
+export async function ensureMailbox(imap, target, boxes = null) {
+  if (!boxes) {
+    boxes = await _listMailboxes(imap);
+  }
   const exists = boxes.some((box) => box.name === target);
   
   if (exists) {
@@ -161,69 +190,177 @@ export async function ensureMailbox(imap, target) {
 
 /**
  * Check if server supports MOVE capability.
+ * Capabilities don't change for the lifetime of a connection, so the
+ * scan result is cached on the handle after the first call.
  * @param {Object} imap - IMAP connection
  * @returns {boolean} True if MOVE is supported
  */
 function _supportsMove(imap) {
-  const caps = imap.serverCapabilities || [];
-  return caps.some((c) => c.toUpperCase() === 'MOVE');
+  if (imap._supportsMoveCached === undefined) {
+    const caps = imap.serverCapabilities || [];
+    imap._supportsMoveCached = caps.some((c) => c.toUpperCase() === 'MOVE');
+  }
+  return imap._supportsMoveCached;
+}
+
+/**
+ * Check if server supports UIDPLUS capability.
+ * Cached on the handle like _supportsMove.
+ * @param {Object} imap - IMAP connection
+ * @returns {boolean} True if UIDPLUS is supported
+ */
+function _supportsUidPlus(imap) {
+  if (imap._supportsUidPlusCached === undefined) {
+    const caps = imap.serverCapabilities || [];
+    imap._supportsUidPlusCached = caps.some((c) => c.toUpperCase() === 'UIDPLUS');
+  }
+  return imap._supportsUidPlusCached;
 }
 
 /**
- * Move a single UID to target mailbox.
- * Uses UID MOVE if supported, otherwise COPY + mark \Deleted + EXPUNGE.
+ * Move a batch of UIDs to target mailbox in a single command.
+ * Uses one UID MOVE if supported, otherwise one COPY + mark \Deleted + one EXPUNGE.
+ * IMAP accepts UID sets natively, so the whole batch costs one round-trip
+ * instead of one per message.
+ * The batch is all-or-nothing: a failure leaves the whole set unmoved,
+ * so 0 means the batch failed, not that there was nothing to move.
  * @param {Object} imap - IMAP connection
- * @param {string} uid - Message UID
+ * @param {Array<string>} uids - Message UIDs
  * @param {string} target - Target mailbox
  * @param {boolean} dryRun - Don't perform actual changes
- * @returns {Promise<boolean>} True on success
+ * @returns {Promise<number>} uids.length on success, 0 if the batch failed
  */
-export async function moveUid(imap, uid, target, dryRun = false) {
-  logger.info('Moving UID to target mailbox', { uid, target, dryRun });
-  
+export async function moveUids(imap, uids, target, dryRun = false) {
+  logger.info('Moving UIDs to target mailbox', { count: uids.length, target, dryRun });
+
   if (dryRun) {
-    logger.info('DRY RUN: would move UID', { uid, target });
-    return true;
+    logger.info('DRY RUN: would move UIDs', { uids, target });
+    return uids.length;
   }
 
   if (_supportsMove(imap)) {
-    return new Promise((resolve) => {
-      imap.move(uid, target, (err) => {
+    const moved = await new Promise((resolve) => {
+      imap.move(uids, target, (err) => {
         if (err) {
-          logger.warn('MOVE failed; falling back to COPY+DELETE', { uid, error: err.message });
+          logger.warn('MOVE failed; falling back to COPY+DELETE', { error: err.message });
           resolve(false);
         } else {
-          logger.info('UID moved via MOVE', { uid });
+          logger.info('UIDs moved via MOVE', { count: uids.length });
           resolve(true);
         }
       });
     });
+    if (moved) return uids.length;
   }
 
-  // Fallback: COPY, mark \Deleted, EXPUNGE
-  logger.info('Falling back to COPY + \\Deleted + EXPUNGE', { uid });
-  
+  // Fallback: one COPY, one mark \Deleted, one EXPUNGE for the whole batch
+  logger.info('Falling back to COPY + \\Deleted + EXPUNGE', { count: uids.length });
+
   try {
     await new Promise((resolve, reject) => {
-      imap.copy(uid, target, (err) => (err ? reject(err) : resolve()));
+      imap.copy(uids, target, (err) => (err ? reject(err) : resolve()));
     });
 
     await new Promise((resolve, reject) => {
-      imap.addFlags(uid, '\\Deleted', (err) => (err ? reject(err) : resolve()));
+      imap.addFlags(uids, '\\Deleted', (err) => (err ? reject(err) : resolve()));
     });
 
     await new Promise((resolve, reject) => {
-      imap.expunge((err) => (err ? reject(err) : resolve()));
+      const done = (err) => (err ? reject(err) : resolve());
+      if (_supportsUidPlus(imap)) {
+        // UID EXPUNGE removes only this batch instead of sweeping every
+        // \Deleted message in the mailbox
+        imap.expunge(uids, done);
+      } else {
+        imap.expunge(done);
+      }
     });
 
-    logger.info('UID moved via fallback', { uid });
-    return true;
+    logger.info('UIDs moved via fallback', { count: uids.length });
+    return uids.length;
   } catch (err) {
-    logger.error('Fallback move failed', { uid, error: err.message });
-    return false;
+    logger.error('Fallback move failed; batch left unmoved', {
+      uids: uids.join(','),
+      error: err.message,
+    });
+    return 0;
   }
 }
 
+// Search keys that take no argument (RFC 3501)
+const SEARCH_UNARY_KEYS = new Set([
+  'ALL', 'ANSWERED', 'DELETED', 'DRAFT', 'FLAGGED', 'NEW', 'OLD', 'RECENT',
+  'SEEN', 'UNANSWERED', 'UNDELETED', 'UNDRAFT', 'UNFLAGGED', 'UNSEEN',
+]);
+
+// Search keys that take exactly one argument (RFC 3501)
+const SEARCH_VALUED_KEYS = new Set([
+  'BCC', 'BEFORE', 'BODY', 'CC', 'FROM', 'KEYWORD', 'LARGER', 'ON',
+  'SENTBEFORE', 'SENTON', 'SENTSINCE', 'SINCE', 'SMALLER', 'SUBJECT',
+  'TEXT', 'TO', 'UID', 'UNKEYWORD',
+]);
+
+/**
+ * Parse a raw search criteria string into node-imap criteria.
+ * Supports unary keys (e.g. UNSEEN) and single-argument keys with
+ * optionally quoted values (e.g. FROM "newsletter@pitchfork.com").
+ * The result feeds a destructive move, so anything else — empty input,
+ * unknown keys, or a valued key without its argument — is rejected
+ * rather than widened into a broader search than the user asked for.
+ * @param {string} raw - Raw criteria string
+ * @returns {Array} node-imap search criteria
+ * @throws {Error} If criteria are empty, unknown, or missing an argument
+ */
+function _parseSearchCriteria(raw) {
+  const tokens = (raw || '').match(/"[^"]*"|\S+/g) || [];
+  if (tokens.length === 0) {
+    throw new Error('Empty search criteria');
+  }
+
+  const criteria = [];
+  for (let i = 0; i < tokens.length; i++) {
+    const key = tokens[i].replace(/^"|"$/g, '').toUpperCase();
+    if (SEARCH_UNARY_KEYS.has(key)) {
+      criteria.push(key);
+    } else if (SEARCH_VALUED_KEYS.has(key)) {
+      const value = i + 1 < tokens.length ? tokens[++i].replace(/^"|"$/g, '') : '';
+      if (!value) {
+        throw new Error(`Search key ${key} requires a value`);
+      }
+      criteria.push([key, value]);
+    } else {
+      throw new Error(`Unsupported search key: ${key}`);
+    }
+  }
+
+  return criteria;
+}
+
+/**
+ * Search a mailbox and return matching UIDs.
+ * Lets the server produce the UID set so callers don't have to run a
+ * separate SEARCH and round-trip the list through the command line.
+ * @param {Object} imap - IMAP connection
+ * @param {string} source - Mailbox to search
+ * @param {string} rawCriteria - Raw search criteria string
+ * @returns {Promise<Array<number>>} Matching UIDs
+ * @throws {Error} If the criteria string is empty or invalid
+ */
+export async function searchMailbox(imap, source, rawCriteria) {
+  // Parse before touching the mailbox so invalid criteria fail fast
+  const criteria = _parseSearchCriteria(rawCriteria);
+
+  await new Promise((resolve, reject) => {
+    imap.openBox(source, false, (err) => (err ? reject(err) : resolve()));
+  });
+
+  logger.info('Searching mailbox', { source, criteria });
+
+  return new Promise((resolve, reject) => {
+    imap.search(criteria, (err, results) => (err ? reject(err) : resolve(results || [])));
+  });
+}
+
 /**
  * Move multiple UIDs to trash folder.
  * @param {Object} imap - IMAP connection
@@ -231,7 +368,8 @@ export async function moveUid(imap, uid, target, dryRun = false) {
  * @param {Array<string>} uids - UIDs to move
  * @param {string} target - Target mailbox (auto-detected if omitted)
  * @param {boolean} dryRun - Don't perform actual changes
- * @returns {Promise<number>} Number of successfully moved UIDs
+ * @returns {Promise<number>} uids.length on success, 0 if the batch failed
+ *   (the batched move is all-or-nothing)
  */
 export async function moveUidsToTrash(imap, source, uids, target = null, dryRun = false) {
   if (!uids || uids.length === 0) {
@@ -247,10 +385,12 @@ export async function moveUidsToTrash(imap, source, uids, target = null, dryRun
 
   let trashFolder = target;
   if (!trashFolder) {
-    trashFolder = await findTrashFolder(imap);
+    // List once and share the result between detection and creation
+    const boxes = await _listMailboxes(imap);
+    trashFolder = await findTrashFolder(imap, boxes);
     if (!trashFolder) {
       const fallback = 'INBOX/Trash';
-      const created = await ensureMailbox(imap, fallback);
+      const created = await ensureMailbox(imap, fallback, boxes);
       if (!created) {
         throw new Error('Could not determine or create trash mailbox');
       }
@@ -260,18 +400,12 @@ export async function moveUidsToTrash(imap, source, uids, target = null, dryRun
 
   logger.info('Using trash folder', { folder: trashFolder });
 
-  let successCount = 0;
-  for (const uid of uids) {
-    try {
-      const ok = await moveUid(imap, uid, trashFolder, dryRun);
-      if (ok) successCount += 1;
-      await new Promise((resolve) => setTimeout(resolve, 200)); // Rate limit
-    } catch (err) {
-      logger.error('Error moving UID', { uid, error: err.message });
-    }
+  try {
+    return await moveUids(imap, uids, trashFolder, dryRun);
+  } catch (err) {
+    logger.error('Error moving UIDs', { uids: uids.join(','), error: err.message });
+    return 0;
   }
-
-  return successCount;
 }
 
 /**
@@ -285,3 +419,86 @@ export async function closeConnection(imap) {
     imap.state === 'CLOSED' ? resolve() : imap.once('close', resolve);
   });
 }
+
+/**
+ * Reusable trash mover holding a persistent IMAP connection.
+ * TLS + LOGIN costs ~400ms per run against iCloud; keeping the handle
+ * open turns repeat invocations into pure command round-trips.
+ * Reconnects lazily after connection errors or server-side drops.
+ */
+export class TrashMover {
+  /**
+   * @param {string} host - IMAP host
+   * @param {string} user - Email address
+   * @param {string} password - Email password
+   * @param {number} port - IMAP port (default: 993)
+   */
+  constructor(host, user, password, port = DEFAULT_PORT) {
+    this.host = host;
+    this.user = user;
+    this.password = password;
+    this.port = port;
+    this.imap = null;
+  }
+
+  /**
+   * Get the live connection, logging in only if needed.
+   * @returns {Promise<Object>} IMAP connection
+   */
+  async _getConnection() {
+    if (this.imap && this.imap.state !== 'disconnected') {
+      return this.imap;
+    }
+
+    const imap = await connect(this.host, this.user, this.password, this.port);
+    imap.once('close', () => {
+      if (this.imap === imap) this.imap = null;
+    });
+    imap.on('error', (err) => {
+      logger.warn('IMAP connection error; will reconnect on next use', { error: err.message });
+      if (this.imap === imap) this.imap = null;
+    });
+    this.imap = imap;
+    return imap;
+  }
+
+  /**
+   * Move UIDs to trash over the persistent connection.
+   * Retries once on a dropped connection.
+   * @param {string} source - Source mailbox
+   * @param {Array<string>} uids - UIDs to move
+   * @param {string} target - Target mailbox (auto-detected if omitted)
+   * @param {boolean} dryRun - Don't perform actual changes
+   * @returns {Promise<number>} uids.length on success, 0 if the batch failed
+   *   (the batched move is all-or-nothing)
+   */
+  async moveUidsToTrash(source, uids, target = null, dryRun = false) {
+    try {
+      const imap = await this._getConnection();
+      return await moveUidsToTrash(imap, source, uids, target, dryRun);
+    } catch (err) {
+      logger.warn('Move failed; reconnecting and retrying once', { error: err.message });
+      // The throw may be a logical failure (bad mailbox, LIST error)
+      // rather than a socket drop, leaving the old handle authenticated;
+      // close it so the keepalive doesn't pin an orphaned session
+      const old = this.imap;
+      this.imap = null;
+      try {
+        old?.end();
+      } catch {}
+      const imap = await this._getConnection();
+      return moveUidsToTrash(imap, source, uids, target, dryRun);
+    }
+  }
+
+  /**
+   * Close the persistent connection.
+   * @returns {Promise<void>}
+   */
+  async close() {
+    if (!this.imap) return;
+    const imap = this.imap;
+    this.imap = null;
+    await closeConnection(imap);
+  }
+}
@@ -9,6 +9,8 @@ import logger from '../../logger.mjs';
 import { stripHtml } from '../../utils/text.mjs';
 
 const CHUNK_SIZE = 100; // Spotify API limit per request
+const PAGE_SIZE = 100; // Max page size for playlist track fetches
+const MAX_PARALLEL_PAGE_FETCHES = 4; // Overlap page requests to hide latency
 
 /**
  * Make authenticated Spotify API request.
@@ -30,7 +32,10 @@ async function _spotifyRequest(method, url, accessToken, body = null) {
 
   if (body) {
     options.body = JSON.stringify(body);
-    logger.debug('Spotify request body', { body, bodyString: options.body });
+    // Runs once per API call; skip the context allocation unless debug is on
+    if (logger.isLevelEnabled('debug')) {
+      logger.debug('Spotify request body', { body, bodyString: options.body });
+    }
   }
 
   const res = await fetch(url, options);
@@ -98,6 +103,42 @@ export async function createPlaylist(accessToken, userId, name, description) {
   );
 }
 
+/**
+ * Fetch all items of a playlist, overlapping page requests.
+ * The first page reports the total, so remaining offsets are known up
+ * front and can be fetched in parallel instead of walking `next` links
+ * one round-trip at a time.
+ * @param {string} accessToken - Spotify access token
+ * @param {string} playlistId - Playlist ID
+ * @param {string} fields - Spotify fields filter (must include `total`)
+ * @returns {Promise<Array>} All playlist items
+ */
+async function _getAllPlaylistItems(accessToken, playlistId, fields) {
+  const base = `https://api.spotify.com/v1/playlists/${encodeURIComponent(playlistId)}/tracks`;
+  const query = `limit=${PAGE_SIZE}&fields=${encodeURIComponent(fields)}`;
+
+  const first = await _spotifyRequest('GET', `${base}?${query}`, accessToken);
+  const items = [...(first.items || [])];
+  const total = first.total ?? items.length;
+
+  const offsets = [];
+  for (let offset = PAGE_SIZE; offset < total; offset += PAGE_SIZE) {
+    offsets.push(offset);
+  }
+
+  for (let i = 0; i < offsets.length; i += MAX_PARALLEL_PAGE_FETCHES) {
+    const batch = offsets.slice(i, i + MAX_PARALLEL_PAGE_FETCHES);
+    const pages = await Promise.all(
+      batch.map((offset) => _spotifyRequest('GET', `${base}?${query}&offset=${offset}`, accessToken))
+    );
+    for (const page of pages) {
+      items.push(...(page.items || []));
+    }
+  }
+
+  return items;
+}
+
 /**
  * Get track URIs from playlist.
  * @param {string} accessToken - Spotify access token
@@ -105,15 +146,11 @@ export async function createPlaylist(accessToken, userId, name, description) {
  * @returns {Promise<Set>} Set of track URIs
  */
 export async function getPlaylistTrackUris(accessToken, playlistId) {
-  const uris = new Set();
-  let url = `https://api.spotify.com/v1/playlists/${encodeURIComponent(playlistId)}/tracks?limit=100`;
+  const items = await _getAllPlaylistItems(accessToken, playlistId, 'items(track(uri)),total');
 
-  while (url) {
-    const data = await _spotifyRequest('GET', url, accessToken);
-    for (const item of data.items || []) {
-      if (item.track?.uri) uris.add(item.track.uri);
-    }
-    url = data.next;
+  const uris = new Set();
+  for (const item of items) {
+    if (item.track?.uri) uris.add(item.track.uri);
   }
 
   return uris;
@@ -146,28 +183,23 @@ export async function addTracksToPlaylist(accessToken, playlistId, trackUris) {
  * @returns {Promise<void>}
  */
 export async function reorderPlaylistByDateAdded(accessToken, playlistId) {
-  const tracks = [];
-  let url = `https://api.spotify.com/v1/playlists/${encodeURIComponent(playlistId)}/tracks?limit=100&fields=items(track(uri),added_at),next`;
+  const items = await _getAllPlaylistItems(accessToken, playlistId, 'items(track(uri),added_at),total');
 
-  while (url) {
-    const data = await _spotifyRequest('GET', url, accessToken);
-    for (const item of data.items || []) {
-      if (item.track?.uri) {
-        tracks.push({
-          uri: item.track.uri,
-          added_at: new Date(item.added_at),
-        });
-      }
+  const tracks = [];
+  for (const item of items) {
+    if (item.track?.uri) {
+      tracks.push({
+        uri: item.track.uri,
+        added_at: new Date(item.added_at),
+      });
     }
-    url = data.next;
   }
 
   if (tracks.length === 0) return;
 
   tracks.sort((a, b) => b.added_at.getTime() - a.added_at.getTime());
 
-  const trackUris = tracks.map((t) => t.uri);
-  const rangeLength = trackUris.length;
+  const rangeLength = tracks.length;
 
   await _spotifyRequest(
     'PUT',
@@ -233,11 +265,12 @@ export async function searchAlbum(accessToken, album, artist) {
     try {
       const data = await _spotifyRequest('GET', url, accessToken);
       if (data.albums?.items?.length > 0) {
-        // For full searches, look for exact match
+        // For full searches, look for exact match; cleanAlbum/cleanArtist
+        // are already lowercased, so only the candidates need normalizing
         if (a && ar) {
           const exact = data.albums.items.find((album) =>
-            album.name?.toLowerCase().includes(cleanAlbum.toLowerCase()) &&
-            album.artists?.some((artist) => artist.name?.toLowerCase().includes(cleanArtist.toLowerCase()))
+            album.name?.toLowerCase().includes(cleanAlbum) &&
+            album.artists?.some((artist) => artist.name?.toLowerCase().includes(cleanArtist))
           );
           if (exact) return exact;
         }
@@ -246,7 +279,7 @@ export async function searchAlbum(accessToken, album, artist) {
         return data.albums.items[0];
       }
     } catch (e) {
-      if (!/maximum length of 250/i.test(String(e?.message))) {
+      if (!String(e?.message).toLowerCase().includes('maximum length of 250')) {
         logger.warn('Album search failed', { album: a, artist: ar, error: e.message });
       }
       continue;
@@ -263,7 +296,8 @@ export async function searchAlbum(accessToken, album, artist) {
  * @returns {Promise<string|null>} Track URI or null
  */
 export async function getAlbumFirstTrackUri(accessToken, albumId) {
-  const url = `https://api.spotify.com/v1/albums/${encodeURIComponent(albumId)}/tracks?limit=50`;
+  // Only the first track is read, so only ask for one
+  const url = `https://api.spotify.com/v1/albums/${encodeURIComponent(albumId)}/tracks?limit=1`;
   const data = await _spotifyRequest('GET', url, accessToken);
   return data.items?.[0]?.uri || null;
 }
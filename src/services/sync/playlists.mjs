@@ -57,8 +57,9 @@ export async function syncPlaylistsFromEmails() {
         continue;
       }
 
-      const rawPairs = extractAlbumArtistPairs(mail.body);
-      const pairs = uniqueBy(rawPairs, (p) => `${p.artist.toLowerCase()}::${p.album.toLowerCase()}`);
+      // extractAlbumArtistPairs already dedupes within an email; cross-email
+      // dedup happens per month below
+      const pairs = extractAlbumArtistPairs(mail.body);
 
       if (!pairs || pairs.length === 0) {
         logger.warn('Email has no album-artist pairs', { uid: mail.uid });
@@ -115,7 +116,10 @@ export async function syncPlaylistsFromEmails() {
             continue;
           }
 
-          if (!existingUris.has(firstTrackUri) && !toAdd.includes(firstTrackUri)) {
+          // existingUris doubles as the seen-set for this batch, so one
+          // membership check covers both playlist and in-flight duplicates
+          if (!existingUris.has(firstTrackUri)) {
+            existingUris.add(firstTrackUri);
             toAdd.push(firstTrackUri);
           }
 
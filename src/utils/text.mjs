@@ -3,6 +3,21 @@
  * Functions for HTML stripping, encoding, and text normalization.
  */
 
+/**
+ * Checks whether a character is a hex digit (0-9, A-F, a-f).
+ * Plain char-code comparison; cheaper than a regex test per character.
+ * @param {string} ch - Single character
+ * @returns {boolean} True if hex digit
+ */
+function _isHexDigit(ch) {
+  const code = ch.charCodeAt(0);
+  return (
+    (code >= 48 && code <= 57) || // 0-9
+    (code >= 65 && code <= 70) || // A-F
+    (code >= 97 && code <= 102) // a-f
+  );
+}
+
 /**
  * Decodes Quoted-Printable encoded text (used in MIME email bodies).
  * Handles sequences like =E2=80=9C (UTF-8) and =\n (soft line breaks).
@@ -19,9 +34,8 @@ export function decodeQuotedPrintable(text) {
   const bytes = [];
   for (let i = 0; i < decoded.length; i++) {
     if (decoded[i] === '=' && i + 2 < decoded.length) {
-      const hex = decoded.substring(i + 1, i + 3);
-      if (/^[0-9A-Fa-f]{2}$/.test(hex)) {
-        bytes.push(parseInt(hex, 16));
+      if (_isHexDigit(decoded[i + 1]) && _isHexDigit(decoded[i + 2])) {
+        bytes.push(parseInt(decoded.substring(i + 1, i + 3), 16));
         i += 2;
         continue;
       }
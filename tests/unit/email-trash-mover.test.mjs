@@ -3,10 +3,59 @@
  */
 
 import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+// Fake node-imap so TrashMover can "connect" without a server; tests that
+// pass their own mock connection objects are unaffected
+vi.mock('node-imap', async () => {
+  const { EventEmitter } = await import('events');
+
+  class FakeImap extends EventEmitter {
+    constructor() {
+      super();
+      this.state = 'disconnected';
+      this.serverCapabilities = ['MOVE'];
+      this.ended = false;
+      FakeImap.instances.push(this);
+    }
+
+    connect() {
+      this.state = 'authenticated';
+      process.nextTick(() => this.emit('ready'));
+    }
+
+    openBox(name, readonly, cb) {
+      if (FakeImap.failNextOpenBox) {
+        FakeImap.failNextOpenBox = false;
+        cb(new Error('NO such mailbox'));
+        return;
+      }
+      cb(null);
+    }
+
+    move(uids, target, cb) {
+      cb(null);
+    }
+
+    end() {
+      this.ended = true;
+      this.state = 'disconnected';
+      process.nextTick(() => this.emit('close', false));
+    }
+  }
+  FakeImap.instances = [];
+  FakeImap.failNextOpenBox = false;
+
+  return { default: FakeImap };
+});
+
+import Imap from 'node-imap';
 import {
   findTrashFolder,
   ensureMailbox,
+  moveUids,
   moveUidsToTrash,
+  searchMailbox,
+  TrashMover,
 } from '../../src/services/email/trash-mover.mjs';
 
 describe('email-trash-mover', () => {
@@ -90,6 +139,95 @@ describe('email-trash-mover', () => {
     });
   });
 
+  describe('searchMailbox', () => {
+    beforeEach(() => {
+      mockImap.search = vi.fn();
+      mockImap.openBox.mockImplementation((name, readonly, cb) => cb(null));
+    });
+
+    it('should parse unary and valued keys into node-imap criteria', async () => {
+      mockImap.search.mockImplementation((criteria, cb) => cb(null, [130, 131]));
+
+      const uids = await searchMailbox(mockImap, 'INBOX', 'UNSEEN FROM "x@y.com"');
+      expect(mockImap.search).toHaveBeenCalledWith(
+        ['UNSEEN', ['FROM', 'x@y.com']],
+        expect.any(Function)
+      );
+      expect(uids).toEqual([130, 131]);
+    });
+
+    it('should reject empty criteria instead of matching everything', async () => {
+      await expect(searchMailbox(mockImap, 'INBOX', '   ')).rejects.toThrow('Empty search criteria');
+      expect(mockImap.openBox).not.toHaveBeenCalled();
+    });
+
+    it('should reject a valued key without an argument', async () => {
+      await expect(searchMailbox(mockImap, 'INBOX', 'UNSEEN FROM')).rejects.toThrow(
+        'FROM requires a value'
+      );
+    });
+
+    it('should reject an unsupported search key', async () => {
+      await expect(searchMailbox(mockImap, 'INBOX', 'HEADER Subject hello')).rejects.toThrow(
+        'Unsupported search key: HEADER'
+      );
+    });
+  });
+
+  describe('moveUids', () => {
+    it('should move the whole batch with one MOVE when supported', async () => {
+      mockImap.serverCapabilities = ['MOVE'];
+      mockImap.move.mockImplementation((uids, target, cb) => cb(null));
+
+      const result = await moveUids(mockImap, ['1', '2', '3'], 'Trash');
+      expect(result).toBe(3);
+      expect(mockImap.move).toHaveBeenCalledTimes(1);
+      expect(mockImap.move).toHaveBeenCalledWith(['1', '2', '3'], 'Trash', expect.any(Function));
+    });
+
+    it('should fall back to COPY + \\Deleted + EXPUNGE without MOVE', async () => {
+      mockImap.serverCapabilities = [];
+      mockImap.copy.mockImplementation((uids, target, cb) => cb(null));
+      mockImap.addFlags.mockImplementation((uids, flags, cb) => cb(null));
+      mockImap.expunge.mockImplementation((cb) => cb(null));
+
+      const result = await moveUids(mockImap, ['1', '2'], 'Trash');
+      expect(result).toBe(2);
+      expect(mockImap.copy).toHaveBeenCalledWith(['1', '2'], 'Trash', expect.any(Function));
+      expect(mockImap.addFlags).toHaveBeenCalledWith(['1', '2'], '\\Deleted', expect.any(Function));
+      expect(mockImap.expunge).toHaveBeenCalledWith(expect.any(Function));
+    });
+
+    it('should scope the fallback expunge to the batch under UIDPLUS', async () => {
+      mockImap.serverCapabilities = ['UIDPLUS'];
+      mockImap.copy.mockImplementation((uids, target, cb) => cb(null));
+      mockImap.addFlags.mockImplementation((uids, flags, cb) => cb(null));
+      mockImap.expunge.mockImplementation((uids, cb) => cb(null));
+
+      const result = await moveUids(mockImap, ['1', '2'], 'Trash');
+      expect(result).toBe(2);
+      expect(mockImap.expunge).toHaveBeenCalledWith(['1', '2'], expect.any(Function));
+    });
+
+    it('should return 0 when the fallback batch fails', async () => {
+      mockImap.serverCapabilities = [];
+      mockImap.copy.mockImplementation((uids, target, cb) => cb(new Error('COPY failed')));
+
+      const result = await moveUids(mockImap, ['1', '2'], 'Trash');
+      expect(result).toBe(0);
+      expect(mockImap.expunge).not.toHaveBeenCalled();
+    });
+
+    it('should not issue commands on dry run', async () => {
+      mockImap.serverCapabilities = ['MOVE'];
+
+      const result = await moveUids(mockImap, ['1', '2'], 'Trash', true);
+      expect(result).toBe(2);
+      expect(mockImap.move).not.toHaveBeenCalled();
+      expect(mockImap.copy).not.toHaveBeenCalled();
+    });
+  });
+
   describe('moveUidsToTrash', () => {
     it('should move UIDs to trash folder', async () => {
       mockImap.serverCapabilities = ['MOVE'];
@@ -113,4 +251,46 @@ describe('email-trash-mover', () => {
       await expect(moveUidsToTrash(mockImap, 'INBOX', [])).rejects.toThrow('No UIDs provided');
     });
   });
+
+  describe('TrashMover', () => {
+    beforeEach(() => {
+      Imap.instances.length = 0;
+      Imap.failNextOpenBox = false;
+    });
+
+    it('should reuse one connection across batches', async () => {
+      const mover = new TrashMover('host', 'user', 'pass');
+
+      await mover.moveUidsToTrash('INBOX', ['1'], 'Trash');
+      await mover.moveUidsToTrash('INBOX', ['2'], 'Trash');
+
+      expect(Imap.instances.length).toBe(1);
+      await mover.close();
+    });
+
+    it('should reconnect lazily after the connection drops', async () => {
+      const mover = new TrashMover('host', 'user', 'pass');
+
+      await mover.moveUidsToTrash('INBOX', ['1'], 'Trash');
+      Imap.instances[0].emit('error', new Error('socket closed'));
+
+      const moved = await mover.moveUidsToTrash('INBOX', ['2'], 'Trash');
+      expect(moved).toBe(1);
+      expect(Imap.instances.length).toBe(2);
+      await mover.close();
+    });
+
+    it('should close the stale connection when retrying a non-connection failure', async () => {
+      const mover = new TrashMover('host', 'user', 'pass');
+      Imap.failNextOpenBox = true;
+
+      // openBox fails server-side; the socket is still up, so the retry
+      // must end the first connection rather than orphan it
+      const moved = await mover.moveUidsToTrash('INBOX', ['1'], 'Trash');
+      expect(moved).toBe(1);
+      expect(Imap.instances.length).toBe(2);
+      expect(Imap.instances[0].ended).toBe(true);
+      await mover.close();
+    });
+  });
 });
@@ -0,0 +1,66 @@
+/**
+ * Unit tests for spotify playlist service
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+vi.mock('node-fetch', () => ({ default: vi.fn() }));
+
+import fetch from 'node-fetch';
+import { getPlaylistTrackUris } from '../../src/services/spotify/playlist.mjs';
+
+/**
+ * Serve playlist track pages for a playlist of the given size: each
+ * request gets 100 items starting at its offset (0 when absent).
+ * @param {number} total - Total tracks in the fake playlist
+ */
+function _mockTrackPages(total) {
+  fetch.mockImplementation(async (url) => {
+    const offset = Number(new URL(url).searchParams.get('offset') || 0);
+    const count = Math.max(0, Math.min(100, total - offset));
+    const items = Array.from({ length: count }, (_, i) => ({
+      track: { uri: `spotify:track:${offset + i}` },
+    }));
+    return { ok: true, json: async () => ({ items, total }) };
+  });
+}
+
+describe('spotify-playlist', () => {
+  beforeEach(() => {
+    fetch.mockReset();
+  });
+
+  describe('getPlaylistTrackUris', () => {
+    it('should fetch remaining pages at offsets derived from the first page total', async () => {
+      _mockTrackPages(250);
+
+      const uris = await getPlaylistTrackUris('token', 'playlist-id');
+
+      expect(uris.size).toBe(250);
+      expect(fetch).toHaveBeenCalledTimes(3);
+
+      const offsets = fetch.mock.calls.map(
+        ([url]) => Number(new URL(url).searchParams.get('offset') || 0)
+      );
+      expect(offsets.sort((a, b) => a - b)).toEqual([0, 100, 200]);
+    });
+
+    it('should not request a trailing page when the total is an exact multiple', async () => {
+      _mockTrackPages(200);
+
+      const uris = await getPlaylistTrackUris('token', 'playlist-id');
+
+      expect(uris.size).toBe(200);
+      expect(fetch).toHaveBeenCalledTimes(2);
+    });
+
+    it('should issue a single request when the first page covers the total', async () => {
+      _mockTrackPages(40);
+
+      const uris = await getPlaylistTrackUris('token', 'playlist-id');
+
+      expect(uris.size).toBe(40);
+      expect(fetch).toHaveBeenCalledTimes(1);
+    });
+  });
+});